@@ -1,5 +1,6 @@
 from __future__ import annotations
 import feedparser
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import List
 from datetime import datetime, timezone
@@ -27,16 +28,22 @@ def _parse_dt(s: str | None) -> datetime | None:
     except Exception:
         return None
 
+def _fetch_feed(q: str):
+    debug_log(f"Fetching news for query: {q}")
+    feed_url = GOOGLE_NEWS_RSS.format(q=q.replace(" ", "%20"))
+    feed = feedparser.parse(feed_url)
+    debug_log(f"Found {len(feed.entries)} entries for query: {q}")
+    return feed
+
 def fetch_news() -> List[NewsItem]:
     items: List[NewsItem] = []
     seen: set[str] = set()
 
-    for q in NEWS_QUERIES:
-        debug_log(f"Fetching news for query: {q}")
-        feed_url = GOOGLE_NEWS_RSS.format(q=q.replace(" ", "%20"))
-        feed = feedparser.parse(feed_url)
-        debug_log(f"Found {len(feed.entries)} entries for query: {q}")
+    # 쿼리별 RSS 요청은 서로 독립적이므로 동시에 가져온다 (결과 순서는 쿼리 순서 유지)
+    with ThreadPoolExecutor(max_workers=len(NEWS_QUERIES) or 1) as ex:
+        feeds = list(ex.map(_fetch_feed, NEWS_QUERIES))
 
+    for feed in feeds:
         for e in feed.entries:
             title = getattr(e, "title", "").strip()
             link = getattr(e, "link", "").strip()
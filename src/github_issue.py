@@ -1,7 +1,12 @@
 from __future__ import annotations
 import requests
+from functools import lru_cache
 from typing import Dict
 
+# GitHub API 호출은 모두 같은 호스트이므로 세션으로 keep-alive 연결을 재사용한다
+_SESSION = requests.Session()
+
+@lru_cache(maxsize=8)
 def _headers(token: str) -> Dict[str, str]:
     return {
         "Authorization": f"Bearer {token}",
@@ -11,7 +16,7 @@ def _headers(token: str) -> Dict[str, str]:
 
 def find_or_create_issue(owner: str, repo: str, token: str, title: str, label: str) -> int:
     url = f"https://api.github.com/repos/{owner}/{repo}/issues"
-    r = requests.get(url, headers=_headers(token), params={"state": "open", "labels": label, "per_page": 50}, timeout=20)
+    r = _SESSION.get(url, headers=_headers(token), params={"state": "open", "labels": label, "per_page": 50}, timeout=20)
     r.raise_for_status()
     issues = r.json()
     for it in issues:
@@ -32,24 +37,24 @@ def find_or_create_issue(owner: str, repo: str, token: str, title: str, label: s
         ),
         "labels": [label]
     }    
-    r2 = requests.post(url, headers=_headers(token), json=payload, timeout=20)
+    r2 = _SESSION.post(url, headers=_headers(token), json=payload, timeout=20)
     r2.raise_for_status()
     return int(r2.json()["number"])
 
 def create_comment(owner: str, repo: str, token: str, issue_number: int, body: str) -> None:
     url = f"https://api.github.com/repos/{owner}/{repo}/issues/{issue_number}/comments"
-    r = requests.post(url, headers=_headers(token), json={"body": body}, timeout=20)
+    r = _SESSION.post(url, headers=_headers(token), json={"body": body}, timeout=20)
     r.raise_for_status()
 
 def list_open_issues_by_label(owner: str, repo: str, token: str, label: str, per_page: int = 100) -> list[dict]:
     url = f"https://api.github.com/repos/{owner}/{repo}/issues"
-    r = requests.get(url, headers=_headers(token), params={"state": "open", "labels": label, "per_page": per_page}, timeout=20)
+    r = _SESSION.get(url, headers=_headers(token), params={"state": "open", "labels": label, "per_page": per_page}, timeout=20)
     r.raise_for_status()
     return r.json() or []
 
 def close_issue(owner: str, repo: str, token: str, issue_number: int) -> None:
     url = f"https://api.github.com/repos/{owner}/{repo}/issues/{issue_number}"
-    r = requests.patch(url, headers=_headers(token), json={"state": "closed"}, timeout=20)
+    r = _SESSION.patch(url, headers=_headers(token), json={"state": "closed"}, timeout=20)
     r.raise_for_status()
 
 def close_other_daily_issues(owner: str, repo: str, token: str, label: str, base_title: str, today_title: str, new_issue_number: int, new_issue_url: str) -> list[int]:
@@ -78,7 +83,7 @@ def close_other_daily_issues(owner: str, repo: str, token: str, label: str, base
 def comment_and_close_issue(owner: str, repo: str, token: str, issue_number: int, body: str) -> None:
     # 먼저 마무리 코멘트 작성
     url_c = f"https://api.github.com/repos/{owner}/{repo}/issues/{issue_number}/comments"
-    rc = requests.post(url_c, headers=_headers(token), json={"body": body}, timeout=20)
+    rc = _SESSION.post(url_c, headers=_headers(token), json={"body": body}, timeout=20)
     rc.raise_for_status()
     # 그 다음 이슈 Close
     close_issue(owner, repo, token, issue_number)
@@ -91,7 +96,7 @@ def comment_and_close_issue(owner: str, repo: str, token: str, issue_number: int
 # =========================================================
 def list_comments(owner: str, repo: str, token: str, issue_number: int) -> list[dict]:
     url = f"https://api.github.com/repos/{owner}/{repo}/issues/{issue_number}/comments"
-    r = requests.get(url, headers=_headers(token), timeout=20)
+    r = _SESSION.get(url, headers=_headers(token), timeout=20)
     r.raise_for_status()
     return r.json() or []
 
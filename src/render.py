@@ -1,26 +1,53 @@
-from typing import List, Any
+from typing import List, Any, Callable, TextIO
 
 import re
 import copy
+from functools import lru_cache
+from io import StringIO
+from operator import itemgetter
 from .extract import RegulationInfo
 from .utils import debug_log
 
+# 단일 문자 치환은 str.translate 한 번으로 처리한다 (CRLF는 먼저 LF로 정규화)
+_ESC_TABLE = str.maketrans({"|": "\\|", "\n": "<br>", "\r": "<br>"})
+
+# 코드 펜스(```, ~~~)는 드물게만 등장하므로 해당 문자가 있을 때만 한 번에 치환한다
+_FENCE_RE = re.compile(r"```|~~~")
+_FENCE_MAP = {"```": "&#96;&#96;&#96;", "~~~": "&#126;&#126;&#126;"}
+
+
+def _fence_repl(m: re.Match) -> str:
+    return _FENCE_MAP[m.group(0)]
+
+
+# 빈 셀과 국가 기본값 '기타'는 이스케이프할 것이 없으므로 캐시도 거치지 않고 그대로 돌려준다
+_SAFE_CELLS = frozenset(("", "기타"))
+
+
 def _esc(s: str) -> str:
     s = str(s or "").strip()
-    s = s.replace("\r\n", "\n").replace("\r", "\n")
-    s = s.replace("```", "&#96;&#96;&#96;")
-    s = s.replace("~~~", "&#126;&#126;&#126;")
-    s = s.replace("|", "\\|")
-    s = s.replace("\n", "<br>")
-    return s
+    if s in _SAFE_CELLS:
+        return s
+    return _esc_cached(s)
+
+
+# 국가/날짜/키워드처럼 반복되는 셀 값은 캐시에서 바로 돌려준다
+@lru_cache(maxsize=4096)
+def _esc_cached(s: str) -> str:
+    if "\r" in s:
+        s = s.replace("\r\n", "\n")
+    if "`" in s or "~" in s:
+        s = _FENCE_RE.sub(_fence_repl, s)
+    return s.translate(_ESC_TABLE)
 
 
+@lru_cache(maxsize=32)
 def _md_sep(col_count: int) -> str:
     return "|" + "---|" * col_count
 
 
 def _mdlink(label: str, url: str) -> str:
-    label = _esc(label)
+    """링크 셀을 만든다. label은 호출 측에서 이미 _esc()를 거친 값이어야 한다."""
     url = (url or "").strip()
     if not url:
         return label
@@ -32,6 +59,11 @@ def _mdlink(label: str, url: str) -> str:
     return f"[{label}]({url})"
 
 
+def _display_title(s: RegulationInfo) -> str:
+    """표/기사 목록에 표시할 제목 (기사 제목 우선, 없으면 규제명)."""
+    return s.article_title or s.case_title or ""
+
+
 def _short(val: str, limit: int = 140) -> str:
     val = val or ""
     if len(val) <= limit:
@@ -40,30 +72,32 @@ def _short(val: str, limit: int = 140) -> str:
 # =====================================================
 # 규제 강도 평가 (Intensity Score)
 # =====================================================
-def calculate_regulation_intensity_score(title: str, reason: str) -> int:
-    score = 0
-    text = f"{title or ''} {reason or ''}".lower()
+def _kw_union(*keywords: str) -> re.Pattern:
+    return re.compile("|".join(map(re.escape, keywords)))
+
 
+# (키워드 패턴, 가산점) — 모듈 로드 시 한 번만 컴파일한다
+_INTENSITY_RULES = (
     # 1. 법안/규제 직접 명시 (Act, Law, Regulation, 기본법) (+30)
-    if any(k in text for k in ["act", "law", "regulation", "bill", "legislation", "규제", "기본법", "법안"]):
-        score += 30
-    
+    (_kw_union("act", "law", "regulation", "bill", "legislation", "규제", "기본법", "법안"), 30),
     # 2. 강력한 규제 조치 (Penalty, Fines, Prohibit, Restriction) (+30)
-    if any(k in text for k in ["penalty", "fine", "prohibit", "restriction", "ban", "enforcement", "처벌", "과징금", "금지"]):
-        score += 30
-    
+    (_kw_union("penalty", "fine", "prohibit", "restriction", "ban", "enforcement", "처벌", "과징금", "금지"), 30),
     # 3. 글로벌 규제 프레임워크 (EU AI Act, Governance, Policy) (+15)
-    if any(k in text for k in ["eu ai act", "governance", "policy", "framework", "guideline", "거버넌스", "정책", "가이드라인"]):
-        score += 15
-    
+    (_kw_union("eu ai act", "governance", "policy", "framework", "guideline", "거버넌스", "정책", "가이드라인"), 15),
     # 4. 저작권 및 지식재산권 관련 규제 (+15)
-    if any(k in text for k in ["copyright", "intellectual property", "ip", "infringement", "저작권", "지식재산권"]):
-        score += 15
-        
+    (_kw_union("copyright", "intellectual property", "ip", "infringement", "저작권", "지식재산권"), 15),
     # 5. 법적 분쟁 및 규제 조치 (+10)
-    if any(k in text for k in ["regulation", "litigation", "legal", "dispute", "소송", "분쟁", "규제"]):
-        score += 10
+    (_kw_union("regulation", "litigation", "legal", "dispute", "소송", "분쟁", "규제"), 10),
+)
+
+
+def calculate_regulation_intensity_score(title: str, reason: str) -> int:
+    return _intensity_from_lower(f"{title or ''} {reason or ''}".lower())
 
+
+def _intensity_from_lower(text: str) -> int:
+    """이미 소문자로 변환된 `제목 + 주요 내용`으로 강도 점수를 계산한다."""
+    score = sum(points for pattern, points in _INTENSITY_RULES if pattern.search(text))
     return min(score, 100)
 
 
@@ -81,85 +115,108 @@ def format_intensity(score: int) -> str:
 # =====================================================
 # 메인 렌더
 # =====================================================
+# 규제 강도 척도 안내는 실행마다 동일하므로 한 번만 만들어 둔다
+_INTENSITY_GUIDE = (
+    "<details>\n"
+    "<summary><strong><span style=\"font-size:2.5em; font-weight:bold;\">📘 AI 규제 강도 점수(0~100) 평가 척도</span></strong></summary>\n\n"
+    "- AI 제품 출시 및 운영에 미치는 규제적 영향력과 법적 구속력을 수치화한 지표입니다.\n"
+    "- 0에 가까울수록 → 권고/가이드라인 위주\n"
+    "- 100에 가까울수록 → 법적 처벌 및 운영 금지 등 고강도 규제\n\n"
+    "\n"
+    "### 📊 등급 기준\n"
+    "-  0~ 39 🟢 : 자율 규제/가이드라인\n"
+    "- 40~ 59 🟡 : 정책 도입 논의 중\n"
+    "- 60~ 79 ⚠️ : 법안 발의 및 강력 권고\n"
+    "- 80~100 🔥 : 법적 구속력 발생 및 고강도 제재\n"
+    "\n"
+    "### 🧮 점수 산정 기준\n"
+    "| 항목 | 조건 (주요 키워드) | 점수 |\n"
+    "|---|---|---|\n"
+    "| 법안/규제 직접 명시 | Act, Law, Regulation, 기본법 등 | +30 |\n"
+    "| 강력한 규제 조치 | Penalty, Fines, Prohibit, 금지 등 | +30 |\n"
+    "| 글로벌 규제 프레임워크 | EU AI Act, Governance, 가이드라인 등 | +15 |\n"
+    "| 저작권/IP 관련 규제 | Copyright, Intellectual Property, 저작권 등 | +15 |\n"
+    "| 법적 분쟁 및 규제 조치 | Regulation, Litigation, 소송 등 | +10 |\n"
+    "\n"
+    "</details>\n"
+)
+
+
 def render_markdown(
     regulations: List[RegulationInfo],
     lookback_days: int = 3,
 ) -> str:
+    buf = StringIO()
+    _render_into(buf.write, regulations, lookback_days)
+    return buf.getvalue()
+
+
+def render_markdown_to(
+    fp: TextIO,
+    regulations: List[RegulationInfo],
+    lookback_days: int = 3,
+) -> None:
+    """리포트를 문자열로 만들지 않고 열린 파일 객체에 바로 기록한다."""
+    _render_into(fp.write, regulations, lookback_days)
+
 
-    lines: List[str] = []
+def _render_into(
+    w: Callable[[str], Any],
+    regulations: List[RegulationInfo],
+    lookback_days: int,
+) -> None:
 
     # KPI (간결 텍스트 요약)
-    lines.append(f"## 📊 최근 {lookback_days}일 규제 동향 요약")
-    lines.append(f"└ 📰 News: {len(regulations)}")
+    w(f"## 📊 최근 {lookback_days}일 규제 동향 요약\n")
+    w(f"└ 📰 News: {len(regulations)}\n")
 
     # 뉴스 테이블
-    lines.append("## 📰 AI Regulation News")
+    w("## 📰 AI Regulation News\n")
     if regulations:
-        debug_log("'News' is printed.")            
-        lines.append("| No. | 기사일자⬇️ | 국가 | 제목 | 조건 (주요 키워드) | 주요 내용 | 규제 강도 점수 |")
-        lines.append(_md_sep(7))
+        debug_log("'News' is printed.")
+        w("| No. | 기사일자⬇️ | 국가 | 제목 | 조건 (주요 키워드) | 주요 내용 | 규제 강도 점수 |\n")
+        w(_md_sep(7))
+        w("\n")
+
+        # 항목별 정렬 키/점수/이스케이프된 제목을 한 번에 만들어 표와 기사 주소 섹션이 공유한다
+        # (점수 계산용 소문자 텍스트는 항목당 한 번만 만든다)
+        prepared = []
+        esc, title_of, score_of = _esc, _display_title, _intensity_from_lower
+        for s in regulations:
+            title = title_of(s)
+            intensity_score = score_of(f"{title} {s.reason or ''}".lower())
+            prepared.append(((s.update_or_filed_date or "", intensity_score), intensity_score, esc(title), s))
 
         # 기사일자 기준으로 정렬 (날짜 내림차순, 동일 날짜 시 강도 내림차순)
-        scored_regulations = []
-        for s in regulations:
-            intensity_score = calculate_regulation_intensity_score(s.article_title or s.case_title, s.reason)
-            scored_regulations.append((intensity_score, s))
-        
-        scored_regulations.sort(key=lambda x: (x[1].update_or_filed_date or "", x[0]), reverse=True)
+        scored_regulations = sorted(prepared, key=itemgetter(0), reverse=True)
 
-        for idx, item_tuple in enumerate(scored_regulations, start=1):
-            intensity_score, s = item_tuple
-            article_url = s.article_urls[0] if getattr(s, "article_urls", None) else ""
-            title_cell = _mdlink(s.article_title or s.case_title, article_url)
+        # 행 루프에서 매번 전역 조회를 하지 않도록 지역 이름으로 묶어 둔다
+        mdlink, short, fmt = _mdlink, _short, format_intensity
+        for idx, (_, intensity_score, esc_title, s) in enumerate(scored_regulations, start=1):
+            article_url = s.article_urls[0] if s.article_urls else ""
+            title_cell = mdlink(esc_title, article_url)
 
-            lines.append(
+            w(
                 f"| {idx} | "
-                f"{_esc(s.update_or_filed_date)} | "
-                f"{_esc(s.country)} | "
+                f"{esc(s.update_or_filed_date)} | "
+                f"{esc(s.country)} | "
                 f"{title_cell} | "
-                f"{_esc(s.matched_keywords)} | "
-                f"{_short(s.reason)} | "
-                f"{format_intensity(intensity_score)} |"
+                f"{esc(s.matched_keywords)} | "
+                f"{short(s.reason)} | "
+                f"{fmt(intensity_score)} |\n"
             )
-        lines.append("")
-    else:
-        lines.append("새로운 규제 소식이 0건입니다.\n")
+        w("\n")
 
-    # 기사 주소
-    if regulations:
-        lines.append("<details>")
-        lines.append("<summary><strong><span style=\"font-size:2.5em; font-weight:bold;\">📰 Source Articles</span></strong></summary>\n")
-        for s in regulations:
-            lines.append(f"### {_esc(s.article_title or s.case_title)}")
+        # 기사 주소 (원래 수집 순서)
+        w("<details>\n")
+        w("<summary><strong><span style=\"font-size:2.5em; font-weight:bold;\">📰 Source Articles</span></strong></summary>\n\n")
+        for _, _, esc_title, s in prepared:
+            w(f"### {esc_title}\n")
             for u in s.article_urls:
-                lines.append(f"- {u}")
-        lines.append("</details>\n")
+                w(f"- {u}\n")
+        w("</details>\n\n")
+    else:
+        w("새로운 규제 소식이 0건입니다.\n\n")
 
     # 규제 강도 척도
-    lines.append("<details>")
-    lines.append("<summary><strong><span style=\"font-size:2.5em; font-weight:bold;\">📘 AI 규제 강도 점수(0~100) 평가 척도</span></strong></summary>\n")
-    lines.append("- AI 제품 출시 및 운영에 미치는 규제적 영향력과 법적 구속력을 수치화한 지표입니다.")
-    lines.append("- 0에 가까울수록 → 권고/가이드라인 위주")
-    lines.append("- 100에 가까울수록 → 법적 처벌 및 운영 금지 등 고강도 규제\n")
-    lines.append("")
-    
-    lines.append("### 📊 등급 기준")
-    lines.append("-  0~ 39 🟢 : 자율 규제/가이드라인")
-    lines.append("- 40~ 59 🟡 : 정책 도입 논의 중")
-    lines.append("- 60~ 79 ⚠️ : 법안 발의 및 강력 권고")
-    lines.append("- 80~100 🔥 : 법적 구속력 발생 및 고강도 제재")
-    lines.append("")
-
-    lines.append("### 🧮 점수 산정 기준")
-    lines.append("| 항목 | 조건 (주요 키워드) | 점수 |")
-    lines.append("|---|---|---|")
-    lines.append("| 법안/규제 직접 명시 | Act, Law, Regulation, 기본법 등 | +30 |")
-    lines.append("| 강력한 규제 조치 | Penalty, Fines, Prohibit, 금지 등 | +30 |")
-    lines.append("| 글로벌 규제 프레임워크 | EU AI Act, Governance, 가이드라인 등 | +15 |")
-    lines.append("| 저작권/IP 관련 규제 | Copyright, Intellectual Property, 저작권 등 | +15 |")
-    lines.append("| 법적 분쟁 및 규제 조치 | Regulation, Litigation, 소송 등 | +10 |")
-    lines.append("")
-
-    lines.append("</details>\n")
-
-    return "\n".join(lines) or ""
+    w(_INTENSITY_GUIDE)
@@ -0,0 +1,71 @@
+import os
+import sys
+
+import yaml
+
+# Ensure src is in path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src import extract
+
+with open(extract.COUNTRIES_PATH, "r", encoding="utf-8") as f:
+    MAPPING = yaml.safe_load(f)
+
+def _by_mapping_order(text: str) -> str:
+    """data/countries.yml을 위에서부터 순서대로 검사하는 기준 구현."""
+    lower = text.lower()
+    for country, keywords in MAPPING.items():
+        if any(kw.lower() in lower for kw in keywords):
+            return country
+    return "기타"
+
+def _detect_all(texts, use_automaton: bool):
+    """오토마톤/폴백 경로 중 하나로 고정해 texts 전체의 국가를 추정한다."""
+    original = extract.ahocorasick
+    try:
+        if not use_automaton:
+            extract.ahocorasick = None
+        extract._country_matcher.cache_clear()
+        return [extract.extract_country(text, "") for text in texts]
+    finally:
+        extract.ahocorasick = original
+        extract._country_matcher.cache_clear()
+
+def _paths():
+    yield "fallback", False
+    if extract.ahocorasick is not None:
+        yield "automaton", True
+
+def test_overlapping_keywords():
+    print("Testing extract_country priority on overlapping keywords")
+    expected = {
+        "guinea-bissau adopts an AI strategy": "기니",
+        "south korea passes the AI basic act": "대한민국",
+        "the eu and global regulators agree": "EU",
+        "global standards for the eu market": "EU",
+        "no country mentioned here": "기타",
+    }
+    for text, country in expected.items():
+        assert _by_mapping_order(text) == country, (text, _by_mapping_order(text))
+    for name, use_automaton in _paths():
+        got = _detect_all(expected, use_automaton)
+        assert got == list(expected.values()), f"{name}: {got}"
+    print("✅ Mapping order respected")
+
+def test_paths_agree():
+    print("\nTesting Aho-Corasick and fallback paths against mapping order")
+    if extract.ahocorasick is None:
+        print("⚠️ pyahocorasick not installed, checking the fallback path only")
+    # 키워드 하나씩만 들어간 텍스트와 여러 국가가 겹치는 텍스트를 모두 확인한다
+    texts = [f"news about {kw} today" for keywords in MAPPING.values() for kw in keywords]
+    texts += ["Ascension and Tristan da Cunha", "france, germany and japan", "미국과 중국, 유럽", ""]
+    want = [_by_mapping_order(text) for text in texts]
+    for name, use_automaton in _paths():
+        got = _detect_all(texts, use_automaton)
+        diffs = [(t, g, w) for t, g, w in zip(texts, got, want) if g != w]
+        assert not diffs, f"{name}: {diffs[:5]}"
+    print(f"✅ {len(texts)} texts agree")
+
+if __name__ == "__main__":
+    test_overlapping_keywords()
+    test_paths_agree()
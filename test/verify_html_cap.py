@@ -0,0 +1,46 @@
+import io
+import os
+import sys
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+# Ensure src is in path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src import extract
+
+def _fake_get(body: bytes, content_type: str):
+    def get(url, **kwargs):
+        r = requests.Response()
+        r.status_code = 200
+        r.url = url
+        r.headers = CaseInsensitiveDict({"Content-Type": content_type})
+        r.raw = io.BytesIO(body)
+        return r
+    return get
+
+def test_cap_mid_character():
+    print("Testing fetch_page_text on a UTF-8 page cut mid-character at MAX_HTML_BYTES")
+    row = "<p>가나다 AI 규제 regulation</p>".encode("utf-8")
+    original_get = extract._SESSION.get
+    try:
+        # 큰 <script> 뒤에 본문을 두어 잘리는 지점이 추출 텍스트 앞부분(20000자 이내)에 오게 하고,
+        # 패딩을 한 줄 길이만큼 바꿔 가며 잘리는 지점이 문자 경계/중간에 모두 걸리게 한다
+        for pad in range(len(row)):
+            head = b"<html><head><meta charset=\"utf-8\"></head><body><script>"
+            head += b"x" * (extract.MAX_HTML_BYTES - len(head) - 2000 + pad) + b"</script>"
+            body = head + row * 200
+            assert len(body) > extract.MAX_HTML_BYTES
+            for content_type in ("text/html; charset=utf-8", "text/html"):
+                extract._SESSION.get = _fake_get(body, content_type)
+                text, _ = extract.fetch_page_text("https://example.com/big")
+                assert text, f"article dropped (pad={pad}, content_type={content_type})"
+                assert "�" not in text, f"broken trailing character (pad={pad})"
+                assert "가나다 AI 규제 regulation" in text
+        print("✅ Capped page parsed")
+    finally:
+        extract._SESSION.get = original_get
+
+if __name__ == "__main__":
+    test_cap_mid_character()
@@ -0,0 +1,45 @@
+import os
+import sys
+
+# Ensure src is in path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.extract import _decode_html, _html_to_text
+
+def test_removed_tags_keep_boundaries():
+    print("Testing _html_to_text keeps text on both sides of removed tags apart")
+    cases = [
+        ("<p>The EU<!-- ad -->regulation</p>", "The EU\nregulation"),
+        ("c<style>s</style>d", "c\nd"),
+        ("<div>a<script>x()</script>b<noscript>n</noscript>c</div>", "a\nb\nc"),
+        ("<p>EU <b>AI</b> Act</p>", "EU \nAI\n Act"),
+    ]
+    for html, expected in cases:
+        text = _html_to_text(html)
+        assert text == expected, f"{html!r}: {text!r} != {expected!r}"
+    print("✅ Boundaries preserved")
+
+def test_lenient_decoding():
+    print("\nTesting _decode_html on pages strict decoding would reject")
+    korean = "<p>한글 기본법</p>"
+    cases = [
+        # 잘못된 바이트가 섞인 페이지
+        (b"<p>ok \xff\xfe bad</p>", "utf-8", "ok"),
+        # charset 선언 없는 EUC-KR 페이지: 글자는 깨져도 기사는 남아야 한다
+        (korean.encode("euc-kr"), None, ""),
+        # 알 수 없는 헤더 charset은 건너뛰고 UTF-8로 읽는다
+        (korean.encode("utf-8"), "x-unknown-charset", "한글 기본법"),
+        # <meta>로 선언된 EUC-KR
+        (b'<meta charset="euc-kr">' + korean.encode("euc-kr"), None, "한글 기본법"),
+        # XML 선언이 붙은 페이지
+        (b'<?xml version="1.0" encoding="utf-8"?>' + korean.encode("utf-8"), None, "한글 기본법"),
+    ]
+    for html, header_encoding, expected in cases:
+        text = _html_to_text(_decode_html(html, header_encoding))
+        assert text.strip(), f"article dropped: {html[:40]!r}"
+        assert expected in text, f"{html[:40]!r}: {text!r}"
+    print("✅ Pages decoded")
+
+if __name__ == "__main__":
+    test_removed_tags_keep_boundaries()
+    test_lenient_decoding()